@@ -8,9 +8,20 @@
 - 一些可以改进的代码模式
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple, Callable, Sequence, Any
 import math
 import json
+import operator
+import threading
+
+
+# 斐波那契前缀缓存：跨调用复用已计算的项，最多保留 _FIB_CACHE_MAX 项以限制内存
+_FIB_CACHE_MAX = 4096
+_fib_cache: List[int] = [0, 1]
+_fib_cache_lock = threading.Lock()
+
+# 单字节年龄（0-255）到年龄段编号的转换表：0 为 0-25，1 为 26-50，2 为 51+
+_AGE_GROUP_TABLE = bytes(0 if age <= 25 else 1 if age <= 50 else 2 for age in range(256))
 
 
 def calculate_circle_area(radius: float) -> float:
@@ -43,17 +54,34 @@ def calculate_fibonacci(n: int) -> List[int]:
     """
     if n <= 0:
         return []
-    if n == 1:
-        return [0]
-    if n == 2:
-        return [0, 1]
-    
-    fib = [0, 1]
-    for i in range(2, n):
-        fib.append(fib[i-1] + fib[i-2])
+
+    with _fib_cache_lock:
+        if n <= len(_fib_cache):
+            return _fib_cache[:n]
+        fib = _fib_cache[:]
+    cached = len(fib)
+
+    # 在缓存前缀的基础上预分配剩余部分，用局部变量滚动计算
+    fib.extend([0] * (n - cached))
+    a, b = fib[cached - 2], fib[cached - 1]
+    for i in range(cached, n):
+        a, b = b, a + b
+        fib[i] = b
+
+    # 其他线程可能已扩展了缓存，按加锁后重新读取的长度续写
+    with _fib_cache_lock:
+        current = len(_fib_cache)
+        if current < _FIB_CACHE_MAX:
+            _fib_cache.extend(fib[current:_FIB_CACHE_MAX])
     return fib
 
 
+def clear_fibonacci_cache():
+    """清空斐波那契数列缓存。"""
+    with _fib_cache_lock:
+        del _fib_cache[2:]
+
+
 def process_user_data(users: List[Dict[str, any]]) -> Dict[str, int]:
     """
     处理用户数据，统计不同年龄段的用户数量。
@@ -64,24 +92,41 @@ def process_user_data(users: List[Dict[str, any]]) -> Dict[str, int]:
     Returns:
         包含年龄段统计的字典
     """
-    age_groups = {
-        'young': 0,      # 0-25
-        'adult': 0,      # 26-50
-        'senior': 0      # 51+
-    }
-    
+    # 计数保存在局部变量中，避免每个用户都做一次字典读写
+    young = adult = senior = 0
     for user in users:
         age = user.get('age', 0)
         if age < 0:
             continue
         elif age <= 25:
-            age_groups['young'] += 1
+            young += 1
         elif age <= 50:
-            age_groups['adult'] += 1
+            adult += 1
         else:
-            age_groups['senior'] += 1
+            senior += 1
     
-    return age_groups
+    return {
+        'young': young,      # 0-25
+        'adult': adult,      # 26-50
+        'senior': senior     # 51+
+    }
+
+
+def count_age_groups(ages: bytes) -> Tuple[int, int, int]:
+    """
+    统计以单字节整数（0-255）紧凑存储的年龄中各年龄段的人数。
+    
+    先用转换表把每个年龄映射为年龄段编号，再按编号计数，全部在 C 层完成，
+    没有逐项的 Python 分支，适合大批量数据。
+    
+    Args:
+        ages: 每个字节表示一个年龄的字节串
+        
+    Returns:
+        (0-25 岁人数, 26-50 岁人数, 51 岁及以上人数)
+    """
+    groups = ages.translate(_AGE_GROUP_TABLE)
+    return groups.count(0), groups.count(1), groups.count(2)
 
 
 def validate_email(email: str) -> bool:
@@ -97,18 +142,12 @@ def validate_email(email: str) -> bool:
     if not email or '@' not in email:
         return False
     
-    parts = email.split('@')
-    if len(parts) != 2:
-        return False
-    
-    local, domain = parts
-    if not local or not domain:
-        return False
-    
-    if '.' not in domain:
+    # partition 只在第一个 '@' 处切分一次，剩余部分只需再查找一次 '@'
+    local, _, domain = email.partition('@')
+    if not local or '@' in domain:
         return False
     
-    return True
+    return '.' in domain
 
 
 def find_max_number(numbers: List[int]) -> Optional[int]:
@@ -123,13 +162,8 @@ def find_max_number(numbers: List[int]) -> Optional[int]:
     """
     if not numbers:
         return None
-    
-    max_num = numbers[0]
-    for num in numbers:
-        if num > max_num:
-            max_num = num
-    
-    return max_num
+    # 内置 max 在 C 层完成逐项比较
+    return max(numbers)
 
 
 def calculate_statistics(data: List[float]) -> Dict[str, float]:
@@ -179,24 +213,25 @@ class Calculator:
     """一个简单的计算器类。"""
     
     def __init__(self):
-        self.history: List[str] = []
+        # 以 (运算符, a, b, 结果) 元组记录历史（批量运算时为列表），在 get_history 中再格式化
+        self.history: List[Tuple[str, Any, Any, Any]] = []
     
     def add(self, a: float, b: float) -> float:
         """加法运算。"""
         result = a + b
-        self.history.append(f"{a} + {b} = {result}")
+        self.history.append(('+', a, b, result))
         return result
     
     def subtract(self, a: float, b: float) -> float:
         """减法运算。"""
         result = a - b
-        self.history.append(f"{a} - {b} = {result}")
+        self.history.append(('-', a, b, result))
         return result
     
     def multiply(self, a: float, b: float) -> float:
         """乘法运算。"""
         result = a * b
-        self.history.append(f"{a} * {b} = {result}")
+        self.history.append(('*', a, b, result))
         return result
     
     def divide(self, a: float, b: float) -> float:
@@ -204,12 +239,43 @@ class Calculator:
         if b == 0:
             raise ValueError("除数不能为0")
         result = a / b
-        self.history.append(f"{a} / {b} = {result}")
+        self.history.append(('/', a, b, result))
         return result
     
+    def _batch(self, symbol: str, op: Callable[[float, float], float],
+               a: Sequence[float], b: Sequence[float],
+               nonzero_divisor: bool = False) -> List[float]:
+        """对两组操作数逐元素运算，并整体记录一条历史。"""
+        # 先复制为列表：既支持迭代器参数，也避免调用方之后修改影响历史
+        a, b = list(a), list(b)
+        if len(a) != len(b):
+            raise ValueError("两组操作数的长度必须相同")
+        if nonzero_divisor and 0 in b:
+            raise ValueError("除数不能为0")
+        result = list(map(op, a, b))
+        self.history.append((symbol, a, b, result))
+        # 返回副本，调用方修改结果不会改写历史
+        return result.copy()
+    
+    def add_batch(self, a: Sequence[float], b: Sequence[float]) -> List[float]:
+        """批量加法运算。"""
+        return self._batch('+', operator.add, a, b)
+    
+    def subtract_batch(self, a: Sequence[float], b: Sequence[float]) -> List[float]:
+        """批量减法运算。"""
+        return self._batch('-', operator.sub, a, b)
+    
+    def multiply_batch(self, a: Sequence[float], b: Sequence[float]) -> List[float]:
+        """批量乘法运算。"""
+        return self._batch('*', operator.mul, a, b)
+    
+    def divide_batch(self, a: Sequence[float], b: Sequence[float]) -> List[float]:
+        """批量除法运算。"""
+        return self._batch('/', operator.truediv, a, b, nonzero_divisor=True)
+    
     def get_history(self) -> List[str]:
         """获取计算历史。"""
-        return self.history.copy()
+        return [f"{a} {op} {b} = {result}" for op, a, b, result in self.history]
     
     def clear_history(self):
         """清空计算历史。"""
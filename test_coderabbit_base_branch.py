@@ -11,7 +11,9 @@
 
 import os
 import sys
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Sequence
+from bisect import bisect_left
+from collections import Counter
 import json
 import hashlib
 
@@ -51,6 +53,10 @@ def process_data_new_way(data_list: List[Dict]) -> List[Dict]:
 
 # ==================== 安全性改进 ====================
 
+# 预先初始化的 SHA-256 上下文，批量哈希时复制它而不是每次重新创建
+_SHA256_PROTO = hashlib.sha256()
+
+
 def hash_password_old(password: str) -> str:
     """
     旧版本的密码哈希 - 安全性较低
@@ -60,13 +66,29 @@ def hash_password_old(password: str) -> str:
 
 def hash_password_new(password: str, salt: Optional[str] = None) -> str:
     """
-    新版本的密码哈希 - 使用更安全的方法
+    新版本的密码哈希 - 使用内存困难的 scrypt 算法
     """
     import secrets
     if salt is None:
         salt = secrets.token_hex(16)
-    combined = password + salt
-    return hashlib.sha256(combined.encode()).hexdigest() + ':' + salt
+    digest = hashlib.scrypt(password.encode(), salt=salt.encode(),
+                            n=16384, r=8, p=1, dklen=32)
+    return digest.hex() + ':' + salt
+
+
+def hash_many(passwords: List[str]) -> List[str]:
+    """
+    批量计算 SHA-256 摘要，用于完整性校验而非密码存储。
+
+    复制一个已初始化的哈希对象代替逐个新建；OpenSSL 会自动使用
+    CPU 的 SHA 扩展指令（如 SHA-NI）。
+    """
+    digests = []
+    for password in passwords:
+        h = _SHA256_PROTO.copy()
+        h.update(password.encode())
+        digests.append(h.hexdigest())
+    return digests
 
 
 # ==================== 错误处理改进 ====================
@@ -114,18 +136,9 @@ def find_duplicates_old(items: List[str]) -> List[str]:
 
 def find_duplicates_new(items: List[str]) -> List[str]:
     """
-    新版本的查找重复项 - O(n) 时间复杂度
+    新版本的查找重复项 - O(n) 时间复杂度，按首次出现顺序返回
     """
-    seen: Set[str] = set()
-    duplicates: Set[str] = set()
-    
-    for item in items:
-        if item in seen:
-            duplicates.add(item)
-        else:
-            seen.add(item)
-    
-    return list(duplicates)
+    return [item for item, count in Counter(items).items() if count > 1]
 
 
 # ==================== 代码重构 ====================
@@ -204,6 +217,25 @@ class UserManagerNew:
     
     def get_all_users(self) -> List[User]:
         return list(self.users.values())
+    
+    def age_histogram(self, bounds: Sequence[int]) -> List[int]:
+        """
+        按升序的年龄上界（含）统计各年龄段人数，返回 len(bounds) + 1 个计数。
+        """
+        counts = [0] * (len(bounds) + 1)
+        for user in self.users.values():
+            counts[bisect_left(bounds, user.age)] += 1
+        return counts
+    
+    def filter_by_age(self, min_age: int, max_age: int) -> List[User]:
+        """
+        返回年龄在 [min_age, max_age] 区间内的用户。
+        """
+        return [
+            user
+            for user in self.users.values()
+            if min_age <= user.age <= max_age
+        ]
 
 
 # ==================== 类型安全改进 ====================
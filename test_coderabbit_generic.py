@@ -13,11 +13,14 @@
 """
 
 import os
+import re
 import json
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Callable, Any, Tuple
+from collections import defaultdict
 from functools import wraps
+from itertools import accumulate, repeat
 from pathlib import Path
 import time
 
@@ -29,6 +32,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 预编译的数字匹配模式，供 extract_numbers 复用
+_NUMBER_RE = re.compile(r'-?\d+\.?\d*')
+
+# 文件名中不安全字符到 '_' 的转换表，供 sanitize_filename 复用
+_UNSAFE_FILENAME_CHARS = str.maketrans(dict.fromkeys('/\\:*?"<>|', '_'))
+
 
 # ==================== 装饰器 ====================
 
@@ -42,12 +51,16 @@ def timing_decorator(func: Callable) -> Callable:
     Returns:
         装饰后的函数
     """
+    name = func.__name__
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        logger.info(f"{func.__name__} 执行时间: {end_time - start_time:.4f} 秒")
+        # 日志级别未开启时跳过消息格式化
+        if logger.isEnabledFor(logging.INFO):
+            elapsed = (time.perf_counter_ns() - start_time) / 1e9
+            logger.info("%s 执行时间: %.4f 秒", name, elapsed)
         return result
     return wrapper
 
@@ -95,14 +108,15 @@ def read_json_file(file_path: str) -> Optional[Dict]:
         解析后的字典，如果文件不存在或格式错误则返回None
     """
     try:
-        if not os.path.exists(file_path):
-            logger.error(f"文件不存在: {file_path}")
-            return None
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            logger.info(f"成功读取文件: {file_path}")
-            return data
+        # 直接打开文件（EAFP），省去一次 os.path.exists 的 stat 调用
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        data = json.loads(content)
+        logger.info(f"成功读取文件: {file_path}")
+        return data
+    except FileNotFoundError:
+        logger.error(f"文件不存在: {file_path}")
+        return None
     except json.JSONDecodeError as e:
         logger.error(f"JSON解析错误: {e}")
         return None
@@ -124,11 +138,15 @@ def write_json_file(data: Dict, file_path: str, indent: int = 2) -> bool:
         成功返回True，失败返回False
     """
     try:
-        # 确保目录存在
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        # 确保目录存在（文件位于当前目录时无需创建）
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
         
+        # 先整体序列化，再一次性写入，避免 json.dump 逐块写文件
+        content = json.dumps(data, indent=indent, ensure_ascii=False)
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+            f.write(content)
             logger.info(f"成功写入文件: {file_path}")
             return True
     except Exception as e:
@@ -164,12 +182,8 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         清理后的文件名
     """
-    # 移除或替换不安全的字符
-    unsafe_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-    sanitized = filename
-    for char in unsafe_chars:
-        sanitized = sanitized.replace(char, '_')
-    return sanitized.strip()
+    # 一次遍历替换所有不安全的字符
+    return filename.translate(_UNSAFE_FILENAME_CHARS).strip()
 
 
 def truncate_string(text: str, max_length: int, suffix: str = "...") -> str:
@@ -189,6 +203,26 @@ def truncate_string(text: str, max_length: int, suffix: str = "...") -> str:
     return text[:max_length - len(suffix)] + suffix
 
 
+def make_truncator(max_length: int, suffix: str = "...") -> Callable[[str], str]:
+    """
+    生成绑定了长度和后缀的截断函数，适合在热路径上反复调用。
+    
+    Args:
+        max_length: 最大长度
+        suffix: 截断后添加的后缀
+        
+    Returns:
+        与 truncate_string(text, max_length, suffix) 结果相同的单参数函数
+    """
+    keep = max_length - len(suffix)
+    
+    def truncate(text: str) -> str:
+        if len(text) <= max_length:
+            return text
+        return text[:keep] + suffix
+    return truncate
+
+
 def extract_numbers(text: str) -> List[float]:
     """
     从字符串中提取所有数字。
@@ -199,10 +233,7 @@ def extract_numbers(text: str) -> List[float]:
     Returns:
         提取到的数字列表
     """
-    import re
-    pattern = r'-?\d+\.?\d*'
-    matches = re.findall(pattern, text)
-    return [float(match) for match in matches]
+    return list(map(float, _NUMBER_RE.findall(text)))
 
 
 # ==================== 日期时间操作 ====================
@@ -253,12 +284,9 @@ def get_date_range(start_date: datetime, end_date: datetime) -> List[datetime]:
     if start_date > end_date:
         return []
     
-    dates = []
-    current_date = start_date
-    while current_date <= end_date:
-        dates.append(current_date)
-        current_date += timedelta(days=1)
-    return dates
+    # 先算出天数，再由 accumulate 在 C 层逐日累加生成日期
+    days = (end_date - start_date).days
+    return list(accumulate(repeat(timedelta(days=1), days), initial=start_date))
 
 
 # ==================== 数据验证 ====================
@@ -362,13 +390,10 @@ def group_by_key(items: List[Dict], key: str) -> Dict[Any, List[Dict]]:
     Returns:
         分组后的字典
     """
-    grouped = {}
+    grouped = defaultdict(list)
     for item in items:
-        group_key = item.get(key)
-        if group_key not in grouped:
-            grouped[group_key] = []
-        grouped[group_key].append(item)
-    return grouped
+        grouped[item.get(key)].append(item)
+    return dict(grouped)
 
 
 def flatten_list(nested_list: List) -> List:
@@ -381,12 +406,17 @@ def flatten_list(nested_list: List) -> List:
     Returns:
         展平后的列表
     """
+    # 用显式的迭代器栈代替递归，避免函数调用开销和深层嵌套时的 RecursionError
     result = []
-    for item in nested_list:
-        if isinstance(item, list):
-            result.extend(flatten_list(item))
-        else:
+    stack = [iter(nested_list)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, list):
+                stack.append(iter(item))
+                break
             result.append(item)
+        else:
+            stack.pop()
     return result
 
 